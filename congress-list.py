@@ -5,220 +5,572 @@ Congressional Contact List Generator
 This script pulls data from the unitedstates/congress-legislators repository
 and creates a CSV file with contact information for all current members of Congress,
 organized by state (alphabetically) and then by district number.
+The output can also be written as JSON or Parquet, optionally gzip-compressed.
 
 Columns: State, name, party, district, phone, url
 """
 
-import csv
+import argparse
+import gzip
+import json
+import operator
 import os
+import pickle
 import sys
 import yaml
-import requests
-from collections import defaultdict
+import httpx
+from concurrent.futures import ThreadPoolExecutor
 
-def download_yaml_file(url, local_filename=None):
-    """Download a YAML file from GitHub."""
-    if local_filename is None:
-        local_filename = url.split('/')[-1]
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    # libyaml bindings unavailable, fall back to the pure-Python loader
+    from yaml import SafeLoader
+
+# Parsed data files are cached here between runs
+_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'quick_congressional_contacts')
+
+# Seconds to wait on connecting to or reading from GitHub; httpx would
+# otherwise give up after 5 seconds of silence mid-download
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=15.0)
+
+# Terms ending before this ISO date belong to former members
+_CURRENT_TERM_CUTOFF = '2025-01-01'
+
+# Keys read from each data file; everything else is skipped while parsing
+_LEGISLATOR_FIELDS = {
+    'id': {'bioguide': True},
+    'name': {'first': True, 'last': True},
+    'terms': {'type': True, 'state': True, 'district': True, 'party': True,
+              'phone': True, 'url': True, 'end': True},
+}
+_SOCIAL_MEDIA_FIELDS = {
+    'id': {'bioguide': True},
+    'social': {'twitter': True, 'facebook': True, 'youtube': True, 'instagram': True},
+}
+
+# Zero-padded district numbers 00-99, for the common case of a valid district
+_DISTRICT_NUMBERS = [f"{i:02d}" for i in range(100)]
+
+# Output column names, in row tuple order
+_FIELDNAMES = ['State', 'name', 'party', 'district', 'phone', 'url',
+               'twitter', 'facebook', 'youtube', 'instagram']
+
+# Shared default for missing mappings; never mutated
+_EMPTY = {}
+
+# (twitter, facebook, youtube, instagram) for members without accounts
+_NO_SOCIAL_MEDIA = ('', '', '', '')
+
+# Full state names keyed by postal abbreviation
+_STATE_NAMES = {
+    'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas', 'CA': 'California',
+    'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware', 'FL': 'Florida', 'GA': 'Georgia',
+    'HI': 'Hawaii', 'ID': 'Idaho', 'IL': 'Illinois', 'IN': 'Indiana', 'IA': 'Iowa',
+    'KS': 'Kansas', 'KY': 'Kentucky', 'LA': 'Louisiana', 'ME': 'Maine', 'MD': 'Maryland',
+    'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota', 'MS': 'Mississippi', 'MO': 'Missouri',
+    'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada', 'NH': 'New Hampshire', 'NJ': 'New Jersey',
+    'NM': 'New Mexico', 'NY': 'New York', 'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio',
+    'OK': 'Oklahoma', 'OR': 'Oregon', 'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina',
+    'SD': 'South Dakota', 'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah', 'VT': 'Vermont',
+    'VA': 'Virginia', 'WA': 'Washington', 'WV': 'West Virginia', 'WI': 'Wisconsin', 'WY': 'Wyoming',
+    'DC': 'District of Columbia', 'PR': 'Puerto Rico', 'AS': 'American Samoa', 'GU': 'Guam',
+    'MP': 'Northern Mariana Islands', 'VI': 'U.S. Virgin Islands'
+}
+
+# Single-letter codes for the major parties; other parties are kept verbatim
+_PARTY_CODES = {'Republican': 'R', 'Democrat': 'D', 'Independent': 'I'}
+
+def get_cache_filename(url):
+    """Return the cache file path for a data file URL."""
+    base_name = os.path.splitext(url.split('/')[-1])[0]
+    return os.path.join(_CACHE_DIR, f"{base_name}.pkl")
+
+def load_cache(cache_file):
+    """Load a cache entry, or return None if it is missing or unreadable."""
+    try:
+        with open(cache_file, 'rb') as f:
+            entry = pickle.load(f)
+    except Exception:
+        # Missing, corrupt or incompatible cache, treat it as a miss; a
+        # damaged pickle can raise almost any exception type
+        return None
+    if not isinstance(entry, dict) or 'data' not in entry:
+        return None
+    return entry
+
+def save_cache(cache_file, entry):
+    """Atomically replace a cache file with a new entry."""
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'wb') as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, cache_file)
+    except OSError as e:
+        print(f"Warning: could not write cache file {cache_file}: {e}")
+
+def create_client():
+    """Create an HTTP client that multiplexes requests to GitHub over HTTP/2."""
+    try:
+        return httpx.Client(http2=True, follow_redirects=True, timeout=_HTTP_TIMEOUT)
+    except ImportError:
+        # The h2 package is missing, so fall back to keep-alive HTTP/1.1
+        return httpx.Client(follow_redirects=True, timeout=_HTTP_TIMEOUT)
+
+class ResponseStream:
+    """Minimal file-like wrapper so the YAML parser can read a streamed response."""
+    
+    def __init__(self, response):
+        self._chunks = response.iter_bytes()
+        self._buffer = bytearray()
     
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+_MERGE_TAG = 'tag:yaml.org,2002:merge'
+_DEFAULT_COLLECTION_TAGS = {
+    yaml.SequenceStartEvent: (yaml.SequenceNode, 'tag:yaml.org,2002:seq'),
+    yaml.MappingStartEvent: (yaml.MappingNode, 'tag:yaml.org,2002:map'),
+}
+
+def _is_anchored(event):
+    """Return True if an event starts a node that defines an anchor."""
+    return event.anchor is not None and not isinstance(event, yaml.AliasEvent)
+
+def _resolve_scalar_tag(loader, event):
+    """Return the tag a scalar event resolves to, as the composer would."""
+    tag = event.tag
+    if tag is None or tag == '!':
+        tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+    return tag
+
+def _skip_yaml_node(loader, event, anchors):
+    """Consume the events of a node without constructing it.
+    
+    Anchored nodes inside the skipped subtree are still built, since an
+    alias elsewhere in the document may refer to them.
+    """
+    if _is_anchored(event):
+        _build_yaml_node(loader, event, True, anchors)
+        return
+    if isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)):
+        return
+    depth = 1
+    while depth:
+        event = loader.get_event()
+        if isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+        elif _is_anchored(event):
+            _build_yaml_node(loader, event, True, anchors)
+        elif isinstance(event, yaml.CollectionStartEvent):
+            depth += 1
+
+def _merge_yaml_mappings(value, merges, fields):
+    """Apply ``<<`` merge keys to a mapping the way SafeConstructor does."""
+    merged = {}
+    for merge in merges:
+        if isinstance(merge, dict):
+            sources = [merge]
+        elif isinstance(merge, list) and all(isinstance(item, dict) for item in merge):
+            # Earlier mappings in a merge sequence take precedence
+            sources = reversed(merge)
+        else:
+            raise yaml.YAMLError("expected a mapping or list of mappings for merging")
+        for source in sources:
+            merged.update(source if fields is True else
+                          {key: item for key, item in source.items() if key in fields})
+    merged.update(value)  # Explicit keys override merged ones
+    return merged
+
+def _build_yaml_node(loader, event, fields, anchors):
+    """Construct a node from parser events, keeping only the requested fields.
+    
+    ``fields`` is True to keep the whole subtree, or a dict mapping the keys
+    to keep to their own ``fields`` spec. A dict spec applied to a sequence
+    filters each of its items.
+    
+    Anchored nodes are always built in full, since an alias may reuse them
+    somewhere a different spec applies.
+    """
+    if isinstance(event, yaml.AliasEvent):
+        if event.anchor not in anchors:
+            raise yaml.YAMLError(f"found undefined alias {event.anchor!r}")
+        return anchors[event.anchor]
+    
+    if event.anchor is not None:
+        fields = True
+    
+    if isinstance(event, yaml.ScalarEvent):
+        tag = _resolve_scalar_tag(loader, event)
+        if tag == 'tag:yaml.org,2002:str':
+            value = event.value
+        else:
+            node = yaml.ScalarNode(tag, event.value, event.start_mark, event.end_mark, event.style)
+            constructor = loader.yaml_constructors.get(tag, loader.yaml_constructors[None])
+            value = constructor(loader, node)
+        if event.anchor is not None:
+            anchors[event.anchor] = value
+        return value
+    
+    # Tagged collections such as !!set or !!omap need their own constructors,
+    # which this reader does not replicate
+    node_class, default_tag = _DEFAULT_COLLECTION_TAGS[type(event)]
+    tag = event.tag
+    if tag is None or tag == '!':
+        tag = loader.resolve(node_class, None, event.implicit)
+    if tag != default_tag:
+        raise yaml.YAMLError(f"unsupported collection tag {tag!r} {event.start_mark}")
+    
+    if isinstance(event, yaml.SequenceStartEvent):
+        value = []
+        while not loader.check_event(yaml.SequenceEndEvent):
+            value.append(_build_yaml_node(loader, loader.get_event(), fields, anchors))
+        loader.get_event()
+        if event.anchor is not None:
+            anchors[event.anchor] = value
+        return value
+    
+    value = {}
+    merges = []
+    while not loader.check_event(yaml.MappingEndEvent):
+        key_event = loader.get_event()
+        if isinstance(key_event, yaml.ScalarEvent) \
+                and _resolve_scalar_tag(loader, key_event) == _MERGE_TAG:
+            merges.append(_build_yaml_node(loader, loader.get_event(), True, anchors))
+            continue
+        key = _build_yaml_node(loader, key_event, True, anchors)
+        value_event = loader.get_event()
+        if fields is True:
+            value[key] = _build_yaml_node(loader, value_event, True, anchors)
+        elif key in fields:
+            value[key] = _build_yaml_node(loader, value_event, fields[key], anchors)
+        else:
+            _skip_yaml_node(loader, value_event, anchors)
+    loader.get_event()
+    
+    if merges:
+        value = _merge_yaml_mappings(value, merges, fields)
+    if event.anchor is not None:
+        anchors[event.anchor] = value
+    return value
+
+def iter_yaml_records(stream, fields, Loader=SafeLoader):
+    """Yield the items of a top-level YAML sequence one at a time.
+    
+    Works on the parser's event stream so that keys outside ``fields`` are
+    skipped without ever being turned into Python objects.
+    """
+    loader = Loader(stream)
     try:
-        response = requests.get(url)
-        response.raise_for_status()  # Raise exception for non-200 status codes
+        loader.get_event()  # StreamStartEvent
+        if loader.check_event(yaml.StreamEndEvent):
+            return
+        loader.get_event()  # DocumentStartEvent
+        if not loader.check_event(yaml.SequenceStartEvent):
+            raise yaml.YAMLError("expected a sequence at the top of the document")
+        loader.get_event()
         
-        with open(local_filename, 'wb') as f:
-            f.write(response.content)
-        
-        return local_filename
-    except requests.exceptions.RequestException as e:
-        print(f"Error downloading file: {e}")
-        sys.exit(1)
+        anchors = {}
+        while not loader.check_event(yaml.SequenceEndEvent):
+            yield _build_yaml_node(loader, loader.get_event(), fields, anchors)
+    finally:
+        loader.dispose()
 
-def load_yaml_data(filename):
-    """Load data from a YAML file."""
+def download_yaml_file(url, client, fields=None):
+    """Download a YAML file from GitHub and return the parsed data.
+    
+    ``client`` is an ``httpx.Client`` as returned by ``create_client``, which
+    already follows redirects.
+    
+    If ``fields`` is given, only those keys of each record are loaded; see
+    ``iter_yaml_records``.
+    
+    The parsed data is cached along with ``fields`` and the file's ETag and
+    Last-Modified validators, which are sent back as a conditional GET on the
+    next run; if upstream answers 304 Not Modified and ``fields`` is unchanged,
+    the cached data is used and the YAML parse is skipped.
+    """
+    cache_file = get_cache_filename(url)
+    cached = load_cache(cache_file)
+    if cached and cached.get('fields') != fields:
+        # Cached under a different field selection, so it can't be reused
+        cached = None
+    
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-        return data
-    except (yaml.YAMLError, IOError) as e:
+        with client.stream('GET', url, headers=headers) as response:
+            if response.status_code == 304 and cached:
+                return cached['data']
+            response.raise_for_status()  # Raise exception for non-200 status codes
+            
+            # Parse straight from the socket instead of buffering the body
+            stream = ResponseStream(response)
+            if fields is None:
+                data = yaml.load(stream, Loader=SafeLoader)
+            else:
+                data = list(iter_yaml_records(stream, fields))
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+    except httpx.HTTPError as e:
+        print(f"Error downloading file: {e}")
+        sys.exit(1)
+    except yaml.YAMLError as e:
         print(f"Error loading YAML file: {e}")
         sys.exit(1)
-
-def get_state_name(state_abbr):
-    """Convert state abbreviation to full state name."""
-    state_names = {
-        'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas', 'CA': 'California',
-        'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware', 'FL': 'Florida', 'GA': 'Georgia',
-        'HI': 'Hawaii', 'ID': 'Idaho', 'IL': 'Illinois', 'IN': 'Indiana', 'IA': 'Iowa',
-        'KS': 'Kansas', 'KY': 'Kentucky', 'LA': 'Louisiana', 'ME': 'Maine', 'MD': 'Maryland',
-        'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota', 'MS': 'Mississippi', 'MO': 'Missouri',
-        'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada', 'NH': 'New Hampshire', 'NJ': 'New Jersey',
-        'NM': 'New Mexico', 'NY': 'New York', 'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio',
-        'OK': 'Oklahoma', 'OR': 'Oregon', 'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina',
-        'SD': 'South Dakota', 'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah', 'VT': 'Vermont',
-        'VA': 'Virginia', 'WA': 'Washington', 'WV': 'West Virginia', 'WI': 'Wisconsin', 'WY': 'Wyoming',
-        'DC': 'District of Columbia', 'PR': 'Puerto Rico', 'AS': 'American Samoa', 'GU': 'Guam',
-        'MP': 'Northern Mariana Islands', 'VI': 'U.S. Virgin Islands'
-    }
-    return state_names.get(state_abbr, state_abbr)
-
-def district_sort_key(district_info):
-    """Create a sorting key for districts to ensure proper ordering."""
-    state, member = district_info
-    if member['district'] == 'Senate':
-        # Place senators after representatives
-        return (state, 999)
-    try:
-        # Extract the district number from district format like "CA-01"
-        district_num = int(member['district'].split('-')[1])
-        return (state, district_num)
-    except (IndexError, ValueError):
-        # Handle special cases like "AL-AL" (at-large)
-        return (state, 0)
+    
+    if etag or last_modified:
+        save_cache(cache_file, {'etag': etag, 'last_modified': last_modified,
+                                'fields': fields, 'data': data})
+    elif cached:
+        # Without validators the old entry can never be revalidated
+        try:
+            os.remove(cache_file)
+        except OSError:
+            pass
+    
+    return data
 
 def process_legislators_data(current_legislators, legislators_social_media=None):
-    """Process legislators data into the format needed for the CSV."""
-    members_by_state = defaultdict(list)
+    """Process legislators data into the format needed for the CSV.
     
-    # Create a lookup for social media info if available
+    Yields ``(state, district_sort_key, row)`` tuples in input order, where
+    ``row`` holds the CSV columns; sort on the first two items to get the
+    output order.
+    """
+    # Create a lookup of (twitter, facebook, youtube, instagram) by bioguide ID
     social_media_lookup = {}
     if legislators_social_media:
         for entry in legislators_social_media:
-            bioguide_id = entry.get('id', {}).get('bioguide')
+            bioguide_id = (entry.get('id') or _EMPTY).get('bioguide')
             if bioguide_id:
-                social_media = entry.get('social', {})
-                social_media_lookup[bioguide_id] = social_media
+                social = entry.get('social') or _EMPTY
+                social_media_lookup[bioguide_id] = (
+                    social.get('twitter', ''),
+                    social.get('facebook', ''),
+                    social.get('youtube', ''),
+                    social.get('instagram', ''),
+                )
+    
+    # Bind module-level lookups to locals; fields may be missing, so plain
+    # .get() is used rather than itemgetter
+    state_names = _STATE_NAMES.get
+    party_codes = _PARTY_CODES.get
+    district_numbers = _DISTRICT_NUMBERS
+    social_media_for = social_media_lookup.get
+    intern = sys.intern
+    empty = _EMPTY
+    cutoff = _CURRENT_TERM_CUTOFF
+    no_social_media = _NO_SOCIAL_MEDIA
     
     for legislator in current_legislators:
         # Skip if no term information
-        if 'terms' not in legislator:
+        terms = legislator.get('terms')
+        if not terms:
             continue
         
         # Get the current/most recent term
-        current_term = legislator['terms'][-1]
+        current_term = terms[-1]
         
         # Only include current legislators
-        if 'end' in current_term and current_term['end'] < '2025-01-01':
+        term_end = current_term.get('end')
+        if term_end is not None and term_end < cutoff:
             continue
         
         # Get legislator's name
-        first_name = legislator.get('name', {}).get('first', '')
-        last_name = legislator.get('name', {}).get('last', '')
+        name_info = legislator.get('name') or empty
+        first_name = name_info.get('first', '')
+        last_name = name_info.get('last', '')
         name = f"{first_name} {last_name}"
         
         # Get state information
         state_abbr = current_term.get('state')
-        state = get_state_name(state_abbr)
+        if state_abbr:
+            # Every member of a delegation shares one string object; values in
+            # _STATE_NAMES and _PARTY_CODES are already shared literals
+            state_abbr = intern(state_abbr)
+        state = state_names(state_abbr, state_abbr)
         
         # Get party
         party = current_term.get('party', '')
-        if party == 'Republican':
-            party = 'R'
-        elif party == 'Democrat':
-            party = 'D'
-        elif party == 'Independent':
-            party = 'I'
+        party = party_codes(party, party)
         
         # Get district information
         term_type = current_term.get('type')
         if term_type == 'sen':
             district = 'Senate'
+            sort_key = 999  # Place senators after representatives
         elif term_type == 'rep':
             district_num = current_term.get('district')
             if district_num == 0:
                 district = f"{state_abbr}-AL"  # At-large district
+            elif state_abbr and 0 < district_num < 100:
+                district = state_abbr + '-' + district_numbers[district_num]
             else:
+                # Unknown (-1) or out-of-range districts, or a missing state
                 district = f"{state_abbr}-{district_num:02d}"
+            # Unknown (-1) districts sort together with at-large ones
+            sort_key = district_num if district_num > 0 else 0
         else:
             district = ''
+            sort_key = 0
         
         # Get contact information
         phone = current_term.get('phone', '')
         url = current_term.get('url', '')
         
         # Get social media information if available
-        twitter = ''
-        facebook = ''
-        youtube = ''
-        instagram = ''
-        
-        # Get bioguide_id for social media lookup
-        bioguide_id = legislator.get('id', {}).get('bioguide')
-        if bioguide_id and bioguide_id in social_media_lookup:
-            social = social_media_lookup[bioguide_id]
-            twitter = social.get('twitter', '')
-            facebook = social.get('facebook', '')
-            youtube = social.get('youtube', '')
-            instagram = social.get('instagram', '')
+        bioguide_id = (legislator.get('id') or empty).get('bioguide')
+        twitter, facebook, youtube, instagram = social_media_for(
+            bioguide_id, no_social_media)
         
-        # Create member entry
-        member = {
-            'State': state,
-            'name': name,
-            'party': party,
-            'district': district,
-            'phone': phone,
-            'url': url,
-            'twitter': twitter,
-            'facebook': facebook,
-            'youtube': youtube,
-            'instagram': instagram
-        }
+        # Create member row in CSV column order
+        member = (state, name, party, district, phone, url,
+                  twitter, facebook, youtube, instagram)
         
-        members_by_state[state].append(member)
-    
-    # Sort entries by state name alphabetically, then by district number
-    sorted_members = []
-    for state in sorted(members_by_state.keys()):
-        # Sort representatives by district number, then add senators
-        state_members = sorted(
-            [(state, member) for member in members_by_state[state]],
-            key=district_sort_key
-        )
-        sorted_members.extend([member for _, member in state_members])
-    
-    return sorted_members
+        yield state, sort_key, member
+
+def format_text_field(value):
+    """Convert a field to text, mapping None to an empty string."""
+    if isinstance(value, str):
+        return value
+    return '' if value is None else str(value)
+
+def format_csv_field(value):
+    """Format a single CSV field, quoting it only when it needs quoting."""
+    value = format_text_field(value)
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
 
-def write_csv(members, output_file='congressional_contacts.csv'):
-    """Write the processed data to a CSV file."""
-    fieldnames = ['State', 'name', 'party', 'district', 'phone', 'url', 
-                 'twitter', 'facebook', 'youtube', 'instagram']
+def open_output_file(output_file, compress=False):
+    """Open an output file for text writing, gzip-compressed if requested."""
+    if compress:
+        # Level 1 is far cheaper than the default and still shrinks the file
+        return gzip.open(output_file, 'wt', compresslevel=1, encoding='utf-8', newline='')
+    return open(output_file, 'w', newline='', encoding='utf-8')
+
+def write_csv(members, output_file='congressional_contacts.csv', compress=False):
+    """Write the processed data (an iterable of row tuples) to a CSV file."""
+    # The output is small, so build it in memory and write it in one call
+    lines = [','.join(_FIELDNAMES)]
+    lines.extend(','.join(map(format_csv_field, member)) for member in members)
+    member_count = len(lines) - 1
+    lines.append('')  # Terminate the last row like csv.writer does
     
     try:
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(members)
+        with open_output_file(output_file, compress) as f:
+            f.write('\r\n'.join(lines))
         
-        print(f"Successfully created {output_file} with {len(members)} entries")
+        print(f"Successfully created {output_file} with {member_count} entries")
         return True
     except IOError as e:
         print(f"Error writing CSV file: {e}")
         return False
 
+def write_json(members, output_file='congressional_contacts.json', compress=False):
+    """Write the processed data to a JSON file as a list of objects."""
+    # Stringify every cell so each column has a single JSON type, e.g. when
+    # YAML reads a numeric social media ID as an int
+    records = [dict(zip(_FIELDNAMES, map(format_text_field, member)))
+               for member in members]
+    
+    try:
+        with open_output_file(output_file, compress) as f:
+            json.dump(records, f, ensure_ascii=False, separators=(',', ':'))
+        
+        print(f"Successfully created {output_file} with {len(records)} entries")
+        return True
+    except IOError as e:
+        print(f"Error writing JSON file: {e}")
+        return False
+
+def write_parquet(members, output_file='congressional_contacts.parquet', compress=False):
+    """Write the processed data to a Parquet file (requires pyarrow)."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("Error writing Parquet file: pyarrow is not installed (pip install pyarrow)")
+        return False
+    
+    # Parquet compresses its column chunks itself, so compress is ignored
+    rows = [tuple(map(format_text_field, member)) for member in members]
+    columns = list(zip(*rows)) or [()] * len(_FIELDNAMES)
+    
+    try:
+        table = pa.table({name: pa.array(column, type=pa.string())
+                          for name, column in zip(_FIELDNAMES, columns)})
+        pq.write_table(table, output_file)
+        
+        print(f"Successfully created {output_file} with {table.num_rows} entries")
+        return True
+    except (IOError, pa.ArrowException) as e:
+        print(f"Error writing Parquet file: {e}")
+        return False
+
+# Writer function for each supported output format
+_WRITERS = {'csv': write_csv, 'json': write_json, 'parquet': write_parquet}
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--format', choices=sorted(_WRITERS), default='csv',
+                        help="output file format (default: csv)")
+    parser.add_argument('--gzip', action='store_true',
+                        help="gzip-compress the output file (csv and json only)")
+    args = parser.parse_args()
+    if args.gzip and args.format == 'parquet':
+        parser.error("--gzip cannot be used with --format parquet")
+    return args
+
 def main():
+    args = parse_args()
+    
     print("Downloading and processing data from unitedstates/congress-legislators...")
     
     # URLs for the data files
     current_legislators_url = 'https://raw.githubusercontent.com/unitedstates/congress-legislators/main/legislators-current.yaml'
     social_media_url = 'https://raw.githubusercontent.com/unitedstates/congress-legislators/main/legislators-social-media.yaml'
     
-    # Download data files
-    current_legislators_file = download_yaml_file(current_legislators_url)
-    social_media_file = download_yaml_file(social_media_url)
-    
-    # Load data
-    current_legislators = load_yaml_data(current_legislators_file)
-    social_media = load_yaml_data(social_media_file)
+    # Download and load both data files concurrently; with HTTP/2 both
+    # requests share a single multiplexed connection
+    with create_client() as client, ThreadPoolExecutor(max_workers=2) as executor:
+        current_future = executor.submit(
+            download_yaml_file, current_legislators_url, client, _LEGISLATOR_FIELDS)
+        social_media_future = executor.submit(
+            download_yaml_file, social_media_url, client, _SOCIAL_MEDIA_FIELDS)
+        current_legislators = current_future.result()
+        social_media = social_media_future.result()
     
-    # Process data
-    members = process_legislators_data(current_legislators, social_media)
+    # Process data, sorting by state name alphabetically, then by district
+    # number with senators after representatives
+    members = sorted(process_legislators_data(current_legislators, social_media),
+                     key=operator.itemgetter(0, 1))
     
-    # Write to CSV
-    write_csv(members)
-    
-    # Clean up downloaded files
-    os.remove(current_legislators_file)
-    os.remove(social_media_file)
+    # Write the output file
+    output_file = f"congressional_contacts.{args.format}"
+    if args.gzip:
+        output_file += '.gz'
+    if not _WRITERS[args.format]((member for _, _, member in members), output_file, args.gzip):
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,116 @@
+import importlib.util
+import io
+import os
+import unittest
+
+import yaml
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'congress-list.py')
+
+spec = importlib.util.spec_from_file_location('congress_list', SCRIPT)
+congress_list = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(congress_list)
+
+LOADERS = [yaml.SafeLoader]
+if getattr(yaml, '__with_libyaml__', False):
+    LOADERS.append(yaml.CSafeLoader)
+
+DOCUMENT = b"""\
+- id: {bioguide: A000001, thomas: '01234'}
+  name: {first: Ada, last: Lovelace}
+  bio: {birthday: 1815-12-10, gender: F}
+  terms:
+  - &first_term {type: rep, start: '2019-01-03', state: NY, district: 12, party: Democrat}
+  - {type: sen, start: '2025-01-03', end: ~, state: NY, phone: !!str 2022240000}
+- id: {bioguide: B000002}
+  name: {first: Charles, last: Babbage, suffix: null}
+  terms: [*first_term]
+- id: {bioguide: C000003}
+  terms:
+  - {<<: *first_term, district: 13}
+  - <<: [{party: Republican, state: CA}, *first_term]
+    url: https://example.house.gov
+- plain scalar
+- [1, [2.5, [true]]]
+"""
+
+FIELDS = {
+    'id': {'bioguide': True},
+    'terms': {'type': True, 'district': True, 'end': True, 'phone': True},
+}
+
+
+class IterYamlRecordsTest(unittest.TestCase):
+
+    def records(self, loader, document, fields):
+        return list(congress_list.iter_yaml_records(io.BytesIO(document), fields, Loader=loader))
+
+    def test_unfiltered_matches_yaml_load(self):
+        expected = yaml.load(DOCUMENT, Loader=yaml.SafeLoader)
+        for loader in LOADERS:
+            with self.subTest(loader=loader.__name__):
+                self.assertEqual(self.records(loader, DOCUMENT, True), expected)
+
+    def test_empty_documents(self):
+        for loader in LOADERS:
+            with self.subTest(loader=loader.__name__):
+                self.assertEqual(self.records(loader, b'', True), [])
+                self.assertEqual(self.records(loader, b'[]\n', True), [])
+
+    def test_filtered_keeps_only_requested_fields(self):
+        full = yaml.load(DOCUMENT, Loader=yaml.SafeLoader)
+        for loader in LOADERS:
+            with self.subTest(loader=loader.__name__):
+                first, second, _ = self.records(loader, DOCUMENT[:DOCUMENT.index(b'- plain')], FIELDS)
+                self.assertEqual(first['id'], {'bioguide': 'A000001'})
+                self.assertNotIn('name', first)
+                self.assertNotIn('bio', first)
+                self.assertEqual(first['terms'][1],
+                                 {'type': 'sen', 'end': None, 'phone': '2022240000'})
+                # Anchored nodes are built in full so aliases see every key
+                self.assertEqual(first['terms'][0], full[0]['terms'][0])
+                self.assertEqual(second['terms'], [full[0]['terms'][0]])
+
+    def test_alias_to_skipped_anchor(self):
+        document = b"- bio: &b {x: 1}\n  terms: [*b]\n"
+        for loader in LOADERS:
+            with self.subTest(loader=loader.__name__):
+                self.assertEqual(self.records(loader, document, {'terms': {'type': True}}),
+                                 [{'terms': [{'x': 1}]}])
+
+    def test_alias_to_anchor_nested_in_skipped_key(self):
+        document = b"- bio: {a: &b {x: 1}}\n  terms: [*b]\n"
+        for loader in LOADERS:
+            with self.subTest(loader=loader.__name__):
+                self.assertEqual(self.records(loader, document, {'terms': {'type': True}}),
+                                 [{'terms': [{'x': 1}]}])
+
+    def test_filtered_merge_keys(self):
+        full = yaml.load(DOCUMENT, Loader=yaml.SafeLoader)
+        for loader in LOADERS:
+            with self.subTest(loader=loader.__name__):
+                third = self.records(loader, DOCUMENT, FIELDS)[2]
+                self.assertEqual(third['terms'], [
+                    {key: term[key] for key in FIELDS['terms'] if key in term}
+                    for term in full[2]['terms']
+                ])
+                self.assertEqual(third['terms'][0]['district'], 13)
+                self.assertEqual(third['terms'][1]['type'], 'rep')
+
+    def test_tagged_collections_are_rejected(self):
+        document = b"- terms: !!set {a, b}\n"
+        for loader in LOADERS:
+            for fields in (True, {'terms': True}):
+                with self.subTest(loader=loader.__name__, fields=fields):
+                    with self.assertRaises(yaml.YAMLError):
+                        self.records(loader, document, fields)
+
+    def test_top_level_mapping_is_rejected(self):
+        for loader in LOADERS:
+            with self.subTest(loader=loader.__name__):
+                with self.assertRaises(yaml.YAMLError):
+                    self.records(loader, b'a: 1\n', True)
+
+
+if __name__ == '__main__':
+    unittest.main()